@@ -91,6 +91,7 @@ class CalculatorApp():
         theme = wasp.system.theme
         line = draw.line
         fill = draw.fill
+        string = draw.string
 
         hi = theme('bright')
         lo = theme('mid')
@@ -123,11 +124,11 @@ class CalculatorApp():
             for y in range(4):
                 label = fields[x + 5*y]
                 if (x == 0):
-                    draw.string(label, x*47+14, y*47+60)
+                    string(label, x*47+14, y*47+60)
                 else:
-                    draw.string(label, x*47+16, y*47+60)
+                    string(label, x*47+16, y*47+60)
         draw.set_color(hi)
-        draw.string("<", 215, 10)
+        string("<", 215, 10)
     
     def _update(self):
         output = self.output if len(self.output) < 12 else self.output[len(self.output)-12:]
@@ -68,7 +68,7 @@ class ClockApp():
         month = now[1] - 1
         month = MONTH[month*3:(month+1)*3]
 
-        return '{} {} {}'.format(now[2], month, now[0])
+        return '%d %s %d' % (now[2], month, now[0])
 
     def _draw(self, redraw=False):
         """Draw or lazily update the display.
@@ -101,13 +101,21 @@ class ClockApp():
                 # Skip the update
                 return
 
-        # Draw the changeable parts of the watch face
+        # Draw the changeable parts of the watch face. Only the minute
+        # units are certain to have changed so the other digits, and the
+        # date, are only redrawn when they differ from what is on display.
         draw.blit(DIGITS[now[4]  % 10], 4*48, 80, fg=hi)
-        draw.blit(DIGITS[now[4] // 10], 3*48, 80, fg=lo)
-        draw.blit(DIGITS[now[3]  % 10], 1*48, 80, fg=hi)
-        draw.blit(DIGITS[now[3] // 10], 0*48, 80, fg=lo)
-        draw.set_color(hi)
-        draw.string(self._day_string(now), 0, 180, width=240)
-
-        # Record the minute that is currently being displayed
+        if redraw or self._min // 10 != now[4] // 10:
+            draw.blit(DIGITS[now[4] // 10], 3*48, 80, fg=lo)
+        if redraw or self._hour != now[3]:
+            draw.blit(DIGITS[now[3]  % 10], 1*48, 80, fg=hi)
+            draw.blit(DIGITS[now[3] // 10], 0*48, 80, fg=lo)
+        day = self._day_string(now)
+        if redraw or self._day != day:
+            draw.set_color(hi)
+            draw.string(day, 0, 180, width=240)
+
+        # Record the time and date that is currently being displayed
         self._min = now[4]
+        self._hour = now[3]
+        self._day = day
@@ -25,6 +25,7 @@ class DualClockApp():
     """Simple digital clock application."""
     NAME = 'Dual'
     _min = None
+    _hour = None
 
     def foreground(self):
         """Activate the application.
@@ -92,11 +93,17 @@ class DualClockApp():
                 # Skip the update
                 return
 
-        # Draw the changeable parts of the watch face
+        # Draw the changeable parts of the watch face. Only the minute
+        # units are certain to have changed so the other digits are only
+        # redrawn when they differ from what is on display.
+        redraw = redraw or self._min is None
         draw.blit(DIGITS[now[4] % 10], 40 + 1*90, 140, fg=hi)
-        draw.blit(DIGITS[now[4] // 10], 40 + 0*90, 140, fg=hi)
-        draw.blit(DIGITS[now[3] % 10], 40 + 1*90, 40, fg=lo)
-        draw.blit(DIGITS[now[3] // 10], 40 + 0*90, 40, fg=lo)
+        if redraw or self._min // 10 != now[4] // 10:
+            draw.blit(DIGITS[now[4] // 10], 40 + 0*90, 140, fg=hi)
+        if redraw or self._hour != now[3]:
+            draw.blit(DIGITS[now[3] % 10], 40 + 1*90, 40, fg=lo)
+            draw.blit(DIGITS[now[3] // 10], 40 + 0*90, 40, fg=lo)
         #draw.roundRect(25, 135, 180, 100, 5, lo)
-        # Record the minute that is currently being displayed
+        # Record the time that is currently being displayed
         self._min = now[4]
+        self._hour = now[3]
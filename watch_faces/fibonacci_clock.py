@@ -93,7 +93,7 @@ class FibonacciClockApp():
 
         month = now[1] - 1
         month = MONTH[month*3:(month+1)*3]
-        draw.string('{} {} {}'.format(now[2], month, now[0]),
+        draw.string('%d %s %d' % (now[2], month, now[0]),
                 0, 202, width=240)
 
         # Record the minute that is currently being displayed
@@ -27,4 +27,4 @@ class WeekClockApp(ClockApp):
         wday = now[6]
         wday = WDAY[wday*3:(wday+1)*3]
 
-        return '{} {} {} {}'.format(wday, now[2], month, now[0])
+        return '%s %d %s %d' % (wday, now[2], month, now[0])
@@ -193,5 +193,5 @@ class WordClockApp():
             sub = self._words[chunks[i]:chunks[i+1]].rstrip()
             draw.string(sub, 0, offset_y+26*i, 240)        
 
-        draw.string('{} {} {}'.format(now[2], month, now[0]),
+        draw.string('%d %s %d' % (now[2], month, now[0]),
                 0, 214, width=240)